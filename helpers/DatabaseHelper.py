@@ -1,5 +1,5 @@
 import sqlite3
-from datetime import datetime
+from datetime import datetime, timedelta
 from logging import Logger
 from typing import Dict, List, Tuple, Union
 
@@ -72,8 +72,12 @@ class Database:
         delete_config_table_sql = """
         DROP TABLE IF EXISTS config;
         """
+        delete_labels_table_sql = """
+        DROP TABLE IF EXISTS labels;
+        """
         self.cursor.execute(delete_sync_table_sql)
         self.cursor.execute(delete_config_table_sql)
+        self.cursor.execute(delete_labels_table_sql)
         self.connection.commit()
         self.__initialize_database()
 
@@ -93,8 +97,15 @@ class Database:
         googleNextSyncToken VARCHAR(100) NULL UNIQUE,
         tokenLastUpdated DATETIME NULL);
         """
+        create_labels_table_sql = """
+        CREATE TABLE IF NOT EXISTS labels (
+        googleLabelName VARCHAR(50) NOT NULL UNIQUE,
+        googleLabelId VARCHAR(50) NOT NULL UNIQUE,
+        labelLastUpdated DATETIME NULL);
+        """
         self.cursor.execute(create_sync_table_sql)
         self.cursor.execute(create_config_table_sql)
+        self.cursor.execute(create_labels_table_sql)
         self.connection.commit()
 
     def insert_data(self, database_entry: DatabaseEntry) -> None:
@@ -208,3 +219,26 @@ class Database:
         self.cursor.execute(delete_sql)
         self.cursor.execute(insert_sql, (token, timestamp))
         self.connection.commit()
+
+    def get_google_label_mapping(self, max_age_hours: int) -> Dict[str, str]:
+        """Returns the cached { labelName : labelId } mapping.
+        Returns an empty dictionary if the cache is empty or older than the given age."""
+        min_timestamp = (datetime.now() - timedelta(hours=max_age_hours)).strftime("%F %H:%M:%S")
+        find_sql = "SELECT COUNT(*) FROM labels WHERE labelLastUpdated < ?"
+        self.cursor.execute(find_sql, (min_timestamp,))
+        if self.cursor.fetchone()[0]:
+            return {}
+        find_sql = "SELECT googleLabelName,googleLabelId FROM labels"
+        self.cursor.execute(find_sql)
+        return dict(self.cursor.fetchall())
+
+    def update_google_label_mapping(self, label_mapping: Dict[str, str]) -> None:
+        """Replaces the cached label mapping with the given one."""
+        timestamp = datetime.now().strftime("%F %H:%M:%S")
+        delete_sql = "DELETE FROM labels"
+        insert_sql = "INSERT INTO labels(googleLabelName, googleLabelId, labelLastUpdated) VALUES(?,?,?)"
+        self.cursor.execute(delete_sql)
+        self.cursor.executemany(
+            insert_sql, [(name, label_id, timestamp) for name, label_id in label_mapping.items()]
+        )
+        self.connection.commit()
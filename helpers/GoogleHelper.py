@@ -1,19 +1,82 @@
 import codecs
+import json
 import os.path
 import pickle
+import random
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache, partial
 from logging import Logger
-from typing import Any, Dict, List, Tuple
+from types import MappingProxyType
+from typing import Any, Dict, Final, FrozenSet, List, Optional, Tuple
 
+import httplib2  # type: ignore
+import orjson
 from google.auth.transport.requests import Request  # type: ignore
 from google.oauth2.credentials import Credentials  # type: ignore
+from google_auth_httplib2 import AuthorizedHttp  # type: ignore
 from google_auth_oauthlib.flow import InstalledAppFlow  # type: ignore
 from googleapiclient.discovery import Resource, build  # type: ignore
 from googleapiclient.errors import HttpError  # type: ignore
+from googleapiclient.http import HttpRequest  # type: ignore
+from googleapiclient.model import JsonModel  # type: ignore
 
 from helpers.DatabaseHelper import Database
 from helpers.Exceptions import ConfigError, GoogleFetchError, InternalError
 
+# Maximum number of resource names accepted by a single people.getBatchGet request
+BATCH_GET_LIMIT = 200
+# Status code of a batch response item for a contact that does not exist (google.rpc.Code)
+NOT_FOUND_CODE = 5
+# Reason stored for contacts skipped by the label filter (or without name)
+FILTERED_REASON = "not allowed by label filter"
+# Maximum number of contacts accepted by a single people.batchCreateContacts request
+BATCH_CREATE_LIMIT = 200
+# Maximum number of concurrent batch requests (People API read quota is 90 requests per minute)
+MAX_WORKERS = 4
+# Maximum age of the label mapping cached in the database
+LABEL_CACHE_HOURS = 24
+# Retry settings for temporary api errors (rate limits and server errors)
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+MAX_ATTEMPTS = 6
+MAX_WAITING_TIME = 60
+SCOPES = ["https://www.googleapis.com/auth/contacts"]
+# Person fields requested when reading contacts
+SYNC_FIELDS: Final[str] = (
+    "addresses,biographies,birthdays,emailAddresses,genders,"
+    "memberships,metadata,names,nicknames,occupations,organizations,phoneNumbers"
+)
+# Person fields written when updating contacts
+UPDATE_FIELDS: Final[str] = (
+    "addresses,biographies,birthdays,clientData,emailAddresses,"
+    "events,externalIds,genders,imClients,interests,locales,locations,memberships,"
+    "miscKeywords,names,nicknames,occupations,organizations,phoneNumbers,relations,"
+    "sipAddresses,urls,userDefined"
+)
+# Read-only template shared by all phone number and email address entries of upload forms
+OTHER_TYPE_TEMPLATE = MappingProxyType({"type": "other"})
+
+
+@lru_cache(maxsize=4096)
+def _parse_label_id(label_string: str) -> str:
+    """Returns the id part of a Google label resource name (e.g. 'contactGroups/<id>')."""
+    return label_string.split("/", 1)[1]
+
+
+class OrjsonModel(JsonModel):
+    """Api response model that decodes json bodies with orjson instead of the json module."""
+
+    def deserialize(self, content: Any) -> Any:
+        try:
+            body = orjson.loads(content)
+        except orjson.JSONDecodeError:
+            # Let the default model handle non-json content
+            return super().deserialize(content)
+        if self._data_wrapper and isinstance(body, dict) and "data" in body:
+            body = body["data"]
+        return body
+
 
 class Google:
     """Handles all Google related (api) stuff."""
@@ -34,53 +97,40 @@ class Google:
         self.is_interactive = is_interactive_sync
         self.database = database_handler
         self.api_requests = 0
-        self.retries = 0
+        self._api_requests_lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="google")
+        self._thread_local = threading.local()
         self.service = self.__build_service()
-        self.label_mapping = self.__get_label_mapping()
-        self.reverse_label_mapping = {label_id: name for name, label_id in self.label_mapping.items()}
-        self.include_labels = [
-            label_id
-            for label in include_labels
-            if (label_id := self.get_label_id(label, create_on_error=False))
-        ]
-        self.exclude_labels = [
-            label_id
-            for label in exclude_labels
-            if (label_id := self.get_label_id(label, create_on_error=False))
-        ]
+        people = self.service.people()
+        self._people_get = partial(people.get, personFields=SYNC_FIELDS)
+        self._people_batch_get = partial(people.getBatchGet, personFields=SYNC_FIELDS)
+        self._people_update = partial(people.updateContact, updatePersonFields=UPDATE_FIELDS)
+        self.label_mapping: Dict[str, str] = {}
+        self.reverse_label_mapping: Dict[str, str] = {}
+        self.include_label_names = include_labels
+        self.exclude_label_names = exclude_labels
+        self.include_labels: List[str] = []
+        self.exclude_labels: List[str] = []
+        self.is_label_mapping_cached = False
+        self.__load_label_mapping(use_cache=not self.is_interactive)
         self.contacts: List[dict] = []
+        self._contacts_by_id: Dict[str, dict] = {}
+        self._unavailable_contacts: Dict[str, str] = {}
+        self._contact_label_ids: Dict[str, Tuple[str, FrozenSet[str]]] = {}
         self.data_already_fetched = False
         self.created_contacts: Dict[str, bool] = {}
-        self.sync_fields = (
-            "addresses,biographies,birthdays,emailAddresses,genders,"
-            "memberships,metadata,names,nicknames,occupations,organizations,phoneNumbers"
-        )
-        self.update_fields = (
-            "addresses,biographies,birthdays,clientData,emailAddresses,"
-            "events,externalIds,genders,imClients,interests,locales,locations,memberships,"
-            "miscKeywords,names,nicknames,occupations,organizations,phoneNumbers,relations,"
-            "sipAddresses,urls,userDefined"
-        )
+        self.sync_fields = SYNC_FIELDS
+        self.update_fields = UPDATE_FIELDS
 
     def __build_service(self) -> Resource:
-        creds: Credentials = None
-        # The file token.pickle stores the user's access and refresh tokens, and is
+        creds: Optional[Credentials] = None
+        # The token file stores the user's access and refresh tokens as json, and is
         # created automatically when the authorization flow completes for the first
         # time.
-        try:
-            if os.path.exists(self.token_file):
-                with open(self.token_file, "r") as base64_token:
-                    creds_pickled = base64_token.read()
-                creds = pickle.loads(codecs.decode(creds_pickled.encode(), "base64"))
-            else:
-                self.log.warning("Google token file not found!")
-        except UnicodeDecodeError:
-            # Maybe old pickling file, try to update
-            with open(self.token_file, "rb") as binary_token:
-                creds = pickle.load(binary_token)
-            creds_str = codecs.encode(pickle.dumps(creds), "base64").decode()
-            with open(self.token_file, "w") as token:
-                token.write(creds_str)
+        if os.path.exists(self.token_file):
+            creds = self.__load_credentials()
+        else:
+            self.log.warning("Google token file not found!")
         # If there are no (valid) credentials available, let the user log in.
         if not creds or not creds.valid:
             if creds and creds.expired and creds.refresh_token:
@@ -88,7 +138,7 @@ class Google:
             elif self.is_interactive:
                 flow = InstalledAppFlow.from_client_secrets_file(
                     self.credentials_file,
-                    scopes=["https://www.googleapis.com/auth/contacts"],
+                    scopes=SCOPES,
                 )
                 creds = flow.run_local_server(
                     port=56411, bind_addr="0.0.0.0", prompt="consent"  # nosec B104
@@ -99,8 +149,9 @@ class Google:
                     "Please run the script using '-i' to acquire a new token (needs user input)."
                 )
                 self.log.info(
-                    f"Debug info: creds={bool(creds)}, valid={creds.valid}, "
-                    f"expired={creds.expired}, refresh_token={bool(creds.refresh_token)}"
+                    f"Debug info: creds={bool(creds)}, valid={getattr(creds, 'valid', None)}, "
+                    f"expired={getattr(creds, 'expired', None)}, "
+                    f"refresh_token={bool(getattr(creds, 'refresh_token', None))}"
                 )
                 print(
                     "Google token not found or invalid!\n"
@@ -108,13 +159,49 @@ class Google:
                 )
                 raise ConfigError("Google token not found or invalid!")
             # Save the credentials for the next run
-            creds_str = codecs.encode(pickle.dumps(creds), "base64").decode()
-            with open(self.token_file, "w") as token:
-                token.write(creds_str)
+            self.__save_credentials(creds)
 
-        service = build("people", "v1", credentials=creds)
+        # Reuse one keep-alive connection for all requests and skip the discovery cache lookup
+        self.credentials = creds
+        http = AuthorizedHttp(creds, http=httplib2.Http(cache=None))
+        service = build("people", "v1", http=http, cache_discovery=False, model=OrjsonModel())
         return service
 
+    def __load_credentials(self) -> Optional[Credentials]:
+        """Loads the credentials from the token file. Returns None if the file is invalid.
+        Token files written by older versions (pickle) are converted to json."""
+        with open(self.token_file, "rb") as token:
+            content = token.read()
+        if content.lstrip().startswith(b"{"):
+            try:
+                return Credentials.from_authorized_user_info(json.loads(content), SCOPES)
+            except ValueError as error:
+                self.log.error(f"Invalid Google token file! Reason: {str(error)}")
+                return None
+        # Maybe old pickled token file, try to convert it
+        try:
+            creds = self.__load_pickled_credentials(content)
+            if not isinstance(creds, Credentials):
+                raise TypeError(f"Unexpected token type '{type(creds).__name__}'")
+        except Exception as error:
+            self.log.error(f"Invalid Google token file! Reason: {str(error)}")
+            return None
+        self.__save_credentials(creds)
+        self.log.info("Converted pickled Google token file to json format")
+        return creds
+
+    def __load_pickled_credentials(self, creds_pickled: bytes) -> Credentials:
+        """Loads credentials written by older versions (base64 encoded or binary pickle)."""
+        try:
+            return pickle.loads(codecs.decode(creds_pickled, "base64"))
+        except (ValueError, pickle.UnpicklingError):
+            return pickle.loads(creds_pickled)
+
+    def __save_credentials(self, creds: Credentials) -> None:
+        """Saves the given credentials as json to the token file."""
+        with open(self.token_file, "w") as token:
+            token.write(creds.to_json())
+
     def get_label_id(self, name: str, create_on_error: bool = True) -> str:
         """Returns the Google label id for a given tag name.
         Creates a new label if it has not been found."""
@@ -125,44 +212,43 @@ class Google:
 
     def get_label_name(self, label_string: str) -> str:
         """Returns the Google label name for a given label id."""
-        label_id = label_string.split("/")[1]
-        return self.reverse_label_mapping.get(label_string, label_id)
+        # The label could be new or renamed in Google but not in the cached mapping
+        if label_string not in self.reverse_label_mapping and self.is_label_mapping_cached:
+            self.__load_label_mapping(use_cache=False)
+        return self.reverse_label_mapping.get(label_string) or _parse_label_id(label_string)
+
+    def refresh_label_mapping(self) -> None:
+        """Fetches the label mapping from Google again, ignoring the database cache."""
+        if self.is_label_mapping_cached:
+            self.__load_label_mapping(use_cache=False)
 
     def __filter_contacts_by_label(self, contact_list: List[dict]) -> List[dict]:
         """Filters a contact list by include/exclude labels."""
-        if self.include_labels:
-            return [
-                contact
-                for contact in contact_list
-                if any(
-                    [
-                        contact_label["contactGroupMembership"]["contactGroupResourceName"]
-                        in self.include_labels
-                        for contact_label in contact["memberships"]
-                    ]
-                )
-                and all(
-                    [
-                        contact_label["contactGroupMembership"]["contactGroupResourceName"]
-                        not in self.exclude_labels
-                        for contact_label in contact["memberships"]
-                    ]
-                )
-            ]
-        elif self.exclude_labels:
-            return [
-                contact
-                for contact in contact_list
-                if all(
-                    [
-                        contact_label["contactGroupMembership"]["contactGroupResourceName"]
-                        not in self.exclude_labels
-                        for contact_label in contact["memberships"]
-                    ]
-                )
-            ]
-        else:
+        if not self.include_labels and not self.exclude_labels:
             return contact_list
+        include_labels = frozenset(self.include_labels)
+        exclude_labels = frozenset(self.exclude_labels)
+        filtered_contact_list = []
+        for contact in contact_list:
+            label_ids = self.__get_contact_label_ids(contact)
+            if (not include_labels or label_ids & include_labels) and not label_ids & exclude_labels:
+                filtered_contact_list.append(contact)
+        return filtered_contact_list
+
+    def __get_contact_label_ids(self, contact: dict) -> FrozenSet[str]:
+        """Returns the label ids of a contact. The result is cached per contact
+        and etag, so a contact only gets scanned again if it has changed."""
+        google_id = contact["resourceName"]
+        etag = contact.get("etag", "")
+        cached = self._contact_label_ids.get(google_id)
+        if cached and cached[0] == etag:
+            return cached[1]
+        label_ids = frozenset(
+            contact_label["contactGroupMembership"]["contactGroupResourceName"]
+            for contact_label in contact.get("memberships", [])
+        )
+        self._contact_label_ids[google_id] = (etag, label_ids)
+        return label_ids
 
     def __filter_unnamed_contacts(self, contact_list: List[dict]) -> List[dict]:
         """Exclude contacts without name."""
@@ -177,11 +263,12 @@ class Google:
                 self.log.info(f"Contact details:\n{self.get_contact_as_string(google_contact)[2:-1]}")
             else:
                 filtered_contact_list.append(google_contact)
-        if len(filtered_contact_list) != len(contact_list):
-            print("\nSkipped one or more unnamed google contacts, see log for details")
 
         return filtered_contact_list
 
+    def __print_unnamed_contacts_skipped(self) -> None:
+        print("\nSkipped one or more unnamed google contacts, see log for details")
+
     def get_contact_names(
         self, google_contact: Dict[str, List[dict]]
     ) -> Tuple[str, str, str, str, str, str, str]:
@@ -232,41 +319,44 @@ class Google:
         """Removes a Google contact internally to avoid further processing
         (e.g. if it has been deleted on both sides)"""
         self.contacts.remove(google_contact)
+        self._contacts_by_id.pop(google_contact["resourceName"], None)
 
     def get_contact(self, google_id: str) -> dict:
         """Fetches a single contact by id from Google."""
         try:
             # Check if contact is already fetched
-            if self.contacts:
-                google_contact_list = [
-                    c for c in self.contacts if str(c["resourceName"]) == str(google_id)
-                ]
-                if google_contact_list:
-                    return google_contact_list[0]
-
-            # Build GET parameters
-            parameters = {
-                "resourceName": google_id,
-                "personFields": self.sync_fields,
-            }
+            google_contact = self._contacts_by_id.get(google_id)
+            if google_contact:
+                return google_contact
+
+            # Check if contact has already been requested without success
+            if google_id in self._unavailable_contacts:
+                reason = self._unavailable_contacts[google_id]
+                if reason == FILTERED_REASON:
+                    raise IndexError(reason)
+                msg = f"Failed to fetch Google contact '{google_id}'! Reason: {reason}"
+                self.log.error(msg)
+                raise GoogleFetchError(msg)
 
             # Fetch contact
-            result = self.service.people().get(**parameters).execute()
-            self.api_requests += 1
+            result = self.__execute(self._people_get(resourceName=google_id))
 
             # Return contact
             google_contact = self.__filter_contacts_by_label([result])[0]
-            google_contact = self.__filter_unnamed_contacts([google_contact])[0]
+            if not self.__filter_unnamed_contacts([google_contact]):
+                self.__print_unnamed_contacts_skipped()
+                raise IndexError("unnamed contact")
             self.contacts.append(google_contact)
+            self._contacts_by_id[google_contact["resourceName"]] = google_contact
             return google_contact
 
         except HttpError as error:
-            if self.__is_temp_error(error):
-                return self.get_contact(google_id)
-            else:
-                msg = f"Failed to fetch Google contact '{google_id}'! Reason: {str(error)}"
-                self.log.error(msg)
-                raise GoogleFetchError(msg) from error
+            msg = f"Failed to fetch Google contact '{google_id}'! Reason: {str(error)}"
+            self.log.error(msg)
+            raise GoogleFetchError(msg) from error
+
+        except GoogleFetchError:
+            raise
 
         except IndexError as error:
             msg = f"Contact processing of '{google_id}' not allowed by label filter"
@@ -278,21 +368,115 @@ class Google:
             self.log.error(msg)
             raise GoogleFetchError(msg) from error
 
-    def __is_temp_error(self, error: HttpError) -> bool:
-        """Checks if the error is a temporary one and retries the request if yes."""
-        quota_waiting_time = 60
-        waiting_time = 0.5
-        max_retries = 5
-        if "Quota exceeded" in str(error):
-            print(f"\nToo many Google requests, waiting {quota_waiting_time} seconds...")
-            time.sleep(quota_waiting_time)
-            return True
-        elif self.retries < max_retries:
-            time.sleep(waiting_time)
-            self.retries += 1
-            return True
-        else:
-            return False
+    def get_contacts_by_id(self, google_ids: List[str]) -> List[dict]:
+        """Fetches multiple contacts by id from Google using batch requests.
+        Already fetched contacts will be taken from the internal contact list.
+        Contacts that could not be fetched or are not allowed by the label filter are skipped
+        and remembered, so later calls (e.g. get_contact) will not request them again.
+        Ids of a failed batch request are skipped but not remembered."""
+        missing_ids = [
+            google_id
+            for google_id in dict.fromkeys(google_ids)
+            if google_id not in self._contacts_by_id and google_id not in self._unavailable_contacts
+        ]
+        chunks = [
+            missing_ids[index : index + BATCH_GET_LIMIT]
+            for index in range(0, len(missing_ids), BATCH_GET_LIMIT)
+        ]
+        futures = {self._executor.submit(self.__fetch_contacts_by_id, chunk): chunk for chunk in chunks}
+        failed_ids = set()
+        skipped_contacts = 0
+        for future in as_completed(futures):
+            try:
+                google_contacts, unavailable_contacts = future.result()
+            except GoogleFetchError:
+                # Already logged, leave these ids to single requests (e.g. by get_contact)
+                failed_ids.update(futures[future])
+                continue
+            self._unavailable_contacts.update(unavailable_contacts)
+            skipped_contacts += self.__add_contacts(google_contacts)
+        if skipped_contacts:
+            self.__print_unnamed_contacts_skipped()
+        for google_id in missing_ids:
+            if google_id not in self._contacts_by_id and google_id not in failed_ids:
+                self._unavailable_contacts.setdefault(google_id, FILTERED_REASON)
+        return [
+            self._contacts_by_id[google_id]
+            for google_id in google_ids
+            if google_id in self._contacts_by_id
+        ]
+
+    def __fetch_contacts_by_id(self, google_ids: List[str]) -> Tuple[List[dict], Dict[str, str]]:
+        """Fetches up to 200 contacts with a single api call. Returns the fetched contacts
+        and a {id: reason} dictionary of contacts that could not be fetched.
+        Runs inside a worker thread, so it uses the connection of that thread."""
+        try:
+            request = self._people_batch_get(resourceNames=google_ids)
+            result = self.__execute(request, http=self.__get_thread_http())
+        except HttpError as error:
+            reason = str(error)
+            msg = f"Failed to fetch Google contacts! Reason: {reason}"
+            self.log.error(msg)
+            raise GoogleFetchError(reason) from error
+
+        # Process result
+        google_contacts = []
+        unavailable_contacts = {}
+        for response in result.get("responses", []):
+            google_id = response.get("requestedResourceName", "-")
+            if "person" not in response:
+                status = response.get("status", {})
+                reason = status.get("message", "unknown")
+                unavailable_contacts[google_id] = reason
+                msg = f"Failed to fetch Google contact '{google_id}'! Reason: {reason}"
+                if status.get("code") == NOT_FOUND_CODE:
+                    # Expected for contacts deleted in Google
+                    self.log.info(msg)
+                else:
+                    self.log.warning(msg)
+                continue
+            google_contacts.append(response["person"])
+        return google_contacts, unavailable_contacts
+
+    def __get_thread_http(self) -> AuthorizedHttp:
+        """Returns the http connection of the current worker thread.
+        httplib2 is not thread-safe, so every worker keeps its own keep-alive connection."""
+        http = getattr(self._thread_local, "http", None)
+        if not http:
+            http = AuthorizedHttp(self.credentials, http=httplib2.Http(cache=None))
+            self._thread_local.http = http
+        return http
+
+    def __execute(self, request: HttpRequest, **kwargs) -> Any:
+        """Executes an api request and counts it.
+        Temporary errors (rate limits, server errors) are retried with exponential backoff."""
+        for attempt in range(MAX_ATTEMPTS):
+            try:
+                result = request.execute(**kwargs)
+                with self._api_requests_lock:
+                    self.api_requests += 1
+                return result
+            except HttpError as error:
+                if error.resp.status not in RETRY_STATUS_CODES:
+                    raise
+                if attempt == MAX_ATTEMPTS - 1:
+                    self.log.warning(
+                        f"Google api error {error.resp.status}, giving up after {MAX_ATTEMPTS} attempts"
+                    )
+                    raise
+                waiting_time = self.__get_waiting_time(error, attempt)
+                msg = f"Google api error {error.resp.status}, retrying in {waiting_time:.1f} seconds..."
+                self.log.info(msg)
+                print("\n" + msg)
+                time.sleep(waiting_time)
+
+    def __get_waiting_time(self, error: HttpError, attempt: int) -> float:
+        """Returns the time to wait before the next retry. Uses the 'Retry-After' header
+        if present, otherwise an exponential backoff with jitter."""
+        retry_after = error.resp.get("retry-after", "")
+        if retry_after.isdigit():
+            return min(float(retry_after), MAX_WAITING_TIME)
+        return min(2**attempt, MAX_WAITING_TIME) + random.uniform(0, 1)  # nosec B311
 
     def get_contacts(self, refetch_data: bool = False, **params) -> List[dict]:
         """Fetches all contacts from Google if not already fetched."""
@@ -321,9 +505,8 @@ class Google:
                 self.log.warning(msg)
                 print("\n" + msg)
                 parameters.pop("syncToken")
+                self.__load_label_mapping(use_cache=False)
                 self.__fetch_contacts(parameters)
-            elif self.__is_temp_error(error):
-                return self.get_contacts(refetch_data, **params)
             else:
                 reason = str(error)
                 msg = f"Failed to fetch Google contacts! Reason: {reason}"
@@ -335,31 +518,67 @@ class Google:
         self.data_already_fetched = True
         return self.contacts
 
+    def __add_contacts(self, contact_list: List[dict]) -> int:
+        """Filters the given contacts and adds them to the internal contact list.
+        Returns the number of skipped unnamed contacts."""
+        contact_list = self.__filter_contacts_by_label(contact_list)
+        named_contact_list = self.__filter_unnamed_contacts(contact_list)
+        for google_contact in named_contact_list:
+            self.contacts.append(google_contact)
+            self._contacts_by_id[google_contact["resourceName"]] = google_contact
+        return len(contact_list) - len(named_contact_list)
+
     def __fetch_contacts(self, parameters: dict) -> None:
-        contacts = []
+        self.contacts = []
+        self._contacts_by_id = {}
+        self._unavailable_contacts = {}
+        skipped_contacts = 0
         while True:
-            result = self.service.people().connections().list(**parameters).execute()
-            self.api_requests += 1
+            result = self.__execute(self.service.people().connections().list(**parameters))
+            skipped_contacts += self.__add_contacts(result.get("connections", []))
             next_page_token = result.get("nextPageToken", False)
-            contacts += result.get("connections", [])
-            if next_page_token:
-                parameters["pageToken"] = next_page_token
-            else:
-                contacts = self.__filter_contacts_by_label(contacts)
-                self.contacts = self.__filter_unnamed_contacts(contacts)
+            if not next_page_token:
                 break
+            parameters["pageToken"] = next_page_token
+        if skipped_contacts:
+            self.__print_unnamed_contacts_skipped()
 
         next_sync_token = result.get("nextSyncToken", None)
         if next_sync_token and self.database:
             self.database.update_google_next_sync_token(next_sync_token)
 
+    def __load_label_mapping(self, use_cache: bool = True) -> None:
+        """Loads the label mappings and resolves the include/exclude label ids.
+        Uses the database cache if allowed and recent enough, but fetches the labels again
+        if a configured label is missing in the cache (e.g. created in Google meanwhile)."""
+        label_mapping = {}
+        if use_cache and self.database:
+            label_mapping = self.database.get_google_label_mapping(LABEL_CACHE_HOURS)
+        self.is_label_mapping_cached = bool(label_mapping)
+        self.__set_label_mapping(label_mapping or self.__get_label_mapping())
+        configured_labels = self.include_label_names + self.exclude_label_names
+        if self.is_label_mapping_cached and any(
+            label not in self.label_mapping for label in configured_labels
+        ):
+            self.__load_label_mapping(use_cache=False)
+            return
+        self.include_labels = [
+            label_id
+            for label in self.include_label_names
+            if (label_id := self.get_label_id(label, create_on_error=False))
+        ]
+        self.exclude_labels = [
+            label_id
+            for label in self.exclude_label_names
+            if (label_id := self.get_label_id(label, create_on_error=False))
+        ]
+
     def __get_label_mapping(self) -> dict:
         """Fetches all contact groups from Google (aka labels) and
-        returns a {name: id} mapping."""
+        returns a {name: id} mapping. Updates the database cache."""
         try:
             # Get all contact groups
-            response = self.service.contactGroups().list(pageSize=1000).execute()
-            self.api_requests += 1
+            response = self.__execute(self.service.contactGroups().list(pageSize=1000))
             groups = response.get("contactGroups", [])
 
             # Initialize mapping for all user groups and allowed system groups
@@ -370,30 +589,48 @@ class Google:
                 or group["name"] in ["myContacts", "starred"]
             }
 
+            if self.database:
+                self.database.update_google_label_mapping(label_mapping)
             return label_mapping
         except HttpError as error:
-            if self.__is_temp_error(error):
-                return self.__get_label_mapping()
-            else:
-                reason = str(error)
-                msg = f"Failed to fetch Google labels! Reason: {reason}"
-                self.log.error(msg)
-                raise GoogleFetchError(str(error)) from error
+            reason = str(error)
+            msg = f"Failed to fetch Google labels! Reason: {reason}"
+            self.log.error(msg)
+            raise GoogleFetchError(str(error)) from error
+
+    def __set_label_mapping(self, label_mapping: Dict[str, str]) -> None:
+        """Replaces the {name: id} label mapping and its {id: name} reverse mapping."""
+        self.label_mapping = label_mapping
+        self.reverse_label_mapping = {label_id: name for name, label_id in label_mapping.items()}
+
+    def __add_label_to_mapping(self, label_name: str, group_id: str) -> None:
+        """Adds a label to both label mappings and the database cache."""
+        self.label_mapping[label_name] = group_id
+        self.reverse_label_mapping[group_id] = label_name
+        if self.database:
+            self.database.update_google_label_mapping(self.label_mapping)
+
+    def __remove_label_from_mapping(self, group_id: str) -> None:
+        """Removes a label from both label mappings and the database cache."""
+        label_name = self.reverse_label_mapping.pop(group_id, None)
+        if label_name:
+            self.label_mapping.pop(label_name, None)
+            if self.database:
+                self.database.update_google_label_mapping(self.label_mapping)
 
     def delete_label(self, group_id) -> None:
         """Deletes a contact group from Google (aka label). Does not delete assigned contacts."""
         try:
-            response = self.service.contactGroups().delete(resourceName=group_id).execute()
-            self.api_requests += 1
+            response = self.__execute(self.service.contactGroups().delete(resourceName=group_id))
         except HttpError as error:
-            if self.__is_temp_error(error):
-                self.delete_label(group_id)
-            else:
-                reason = str(error)
-                msg = f"Failed to delete Google contact group. Reason: {reason}"
-                self.log.warning(msg)
-                print("\n" + msg)
-                raise GoogleFetchError(reason) from error
+            reason = str(error)
+            msg = f"Failed to delete Google contact group. Reason: {reason}"
+            self.log.warning(msg)
+            print("\n" + msg)
+            raise GoogleFetchError(reason) from error
+
+        # Update label mapping
+        self.__remove_label_from_mapping(group_id)
 
         if response:
             msg = f"Non-empty response received, please check carefully: {response}"
@@ -406,53 +643,37 @@ class Google:
         if label_name in self.label_mapping:
             return self.label_mapping[label_name]
 
+        # The label could exist in Google but not in the cached mapping
+        if self.is_label_mapping_cached:
+            self.__load_label_mapping(use_cache=False)
+            if label_name in self.label_mapping:
+                return self.label_mapping[label_name]
+
         # Create group object
         new_group = {"contactGroup": {"name": label_name}}
 
         try:
             # Upload group object
-            response = self.service.contactGroups().create(body=new_group).execute()
-            self.api_requests += 1
+            response = self.__execute(self.service.contactGroups().create(body=new_group))
 
             group_id = response.get("resourceName", "contactGroups/myContacts")
-            self.label_mapping.update({label_name: group_id})
-            self.reverse_label_mapping.update({group_id: label_name})
+            self.__add_label_to_mapping(label_name, group_id)
             return group_id
 
         except HttpError as error:
-            if self.__is_temp_error(error):
-                return self.create_label(label_name)
-            else:
-                reason = str(error)
-                msg = f"Failed to create Google label! Reason: {reason}"
-                self.log.error(msg)
-                raise GoogleFetchError(str(error)) from error
+            reason = str(error)
+            msg = f"Failed to create Google label! Reason: {reason}"
+            self.log.error(msg)
+            raise GoogleFetchError(str(error)) from error
 
     def create_contact(self, data: dict) -> dict:
         """Creates a given Google contact via api call and returns the created contact."""
-        # Upload contact
-        try:
-            result = (
-                self.service.people().createContact(personFields=self.sync_fields, body=data).execute()
-            )
-            self.api_requests += 1
-        except HttpError as error:
-            if self.__is_temp_error(error):
-                return self.create_contact(data)
-            else:
-                reason = str(error)
-                msg = f"'{data['names'][0]}':Failed to create Google contact. Reason: {reason}"
-                self.log.error(msg)
-                print("\n" + msg)
-                raise GoogleFetchError(reason) from error
-
-        # Process result
-        google_id = result["resourceName"]
-        name = result["names"][0]["displayName"]
-        self.created_contacts[google_id] = True
-        self.contacts.append(result)
-        self.log.info(f"'{name}': Contact with id '{google_id}' created successfully")
-        return result
+        created_contacts = self.create_contacts_by_key({"0": data})
+        if not created_contacts:
+            msg = f"'{data['names'][0]}':Failed to create Google contact."
+            print("\n" + msg)
+            raise GoogleFetchError(msg)
+        return created_contacts["0"]
 
     def update_contacts(self, data: List[dict]) -> List[dict]:
         """Updates a given Google contact list via api call and returns the updated contacts."""
@@ -467,17 +688,13 @@ class Google:
         }
         # Upload contacts
         try:
-            results = self.service.people().batchUpdateContacts(body=body).execute()
-            self.api_requests += 1
+            results = self.__execute(self.service.people().batchUpdateContacts(body=body))
         except HttpError as error:
-            if self.__is_temp_error(error):
-                return self.update_contacts(data)
-            else:
-                reason = str(error)
-                msg = f"Failed to update Google contacts. Reason: {reason}"
-                self.log.warning(msg)
-                print("\n" + msg)
-                raise GoogleFetchError(reason) from error
+            reason = str(error)
+            msg = f"Failed to update Google contacts. Reason: {reason}"
+            self.log.warning(msg)
+            print("\n" + msg)
+            raise GoogleFetchError(reason) from error
 
         # Process result
         results = results["updateResult"].values()
@@ -502,17 +719,13 @@ class Google:
         body = {"resourceNames": list(data)}
         # Delete contacts
         try:
-            self.service.people().batchDeleteContacts(body=body).execute()
-            self.api_requests += 1
+            self.__execute(self.service.people().batchDeleteContacts(body=body))
         except HttpError as error:
-            if self.__is_temp_error(error):
-                return self.delete_contacts(data)
-            else:
-                reason = str(error)
-                msg = f"Failed to delete Google contacts. Reason: {reason}"
-                self.log.warning(msg)
-                print("\n" + msg)
-                raise GoogleFetchError(reason) from error
+            reason = str(error)
+            msg = f"Failed to delete Google contacts. Reason: {reason}"
+            self.log.warning(msg)
+            print("\n" + msg)
+            raise GoogleFetchError(reason) from error
 
         # Finished
         for google_id, display_name in data.items():
@@ -520,37 +733,64 @@ class Google:
 
     def create_contacts(self, data: List[dict]) -> List[dict]:
         """Creates a given Google contact list via api call and returns the created contacts."""
-        assert len(data) < 200, "Too many contacts for batch create!"
+        created_contacts = self.create_contacts_by_key(
+            {str(num): contact for num, contact in enumerate(data)}
+        )
+        return list(created_contacts.values())
+
+    def create_contacts_by_key(self, data: Dict[str, dict]) -> Dict[str, dict]:
+        """Creates the given {key: contact} Google contacts using batch requests (200 per call).
+        Returns a {key: created contact} dictionary, failed contacts are skipped."""
+        keys = list(data)
+        created_contacts = {}
+        for index in range(0, len(keys), BATCH_CREATE_LIMIT):
+            chunk = keys[index : index + BATCH_CREATE_LIMIT]
+            results = self.__create_contacts_batch([data[key] for key in chunk])
+            if len(results) != len(chunk):
+                msg = f"Unexpected batch create response length ({len(results)} of {len(chunk)})!"
+                self.log.error(msg)
+                raise GoogleFetchError(msg)
+            for key, contact in zip(chunk, results):
+                if contact:
+                    created_contacts[key] = contact
+        return created_contacts
+
+    def __create_contacts_batch(self, data: List[dict]) -> List[Optional[dict]]:
+        """Creates up to 200 Google contacts with a single api call.
+        Returns the created contacts in request order (None if a creation failed)."""
         if not data:
             return []
         # Prepare body
         body = {
             "contacts": [{"contactPerson": contact} for contact in data],
-            "readMask": self.update_fields,
+            "readMask": SYNC_FIELDS,
         }
         # Upload contacts
         try:
-            results = self.service.people().batchCreateContacts(body=body).execute()
-            self.api_requests += 1
+            results = self.__execute(self.service.people().batchCreateContacts(body=body))
         except HttpError as error:
-            if self.__is_temp_error(error):
-                return self.create_contacts(data)
-            else:
-                reason = str(error)
-                msg = f"Failed to create Google contacts. Reason: {reason}"
-                self.log.warning(msg)
-                print("\n" + msg)
-                raise GoogleFetchError(reason) from error
+            reason = str(error)
+            msg = f"Failed to create Google contacts. Reason: {reason}"
+            self.log.warning(msg)
+            print("\n" + msg)
+            raise GoogleFetchError(reason) from error
 
         # Process result
-        contacts = []
-        for item in results["createdPeople"]:
-            contact = item["person"]
+        contacts: List[Optional[dict]] = []
+        for item in results.get("createdPeople", []):
+            contact = item.get("person", {})
             google_id = contact.get("resourceName", "-")
             name = contact.get("names", [{}])[0].get("displayName", "error")
-            if item["httpStatusCode"] != 200:
-                self.log.error(f"'{name}': Failed to create contact with id '{google_id}'!")
+            if item.get("httpStatusCode") != 200 or not contact:
+                reason = item.get("status", {}).get("message", "unknown")
+                self.log.error(
+                    f"'{name}': Failed to create contact with id '{google_id}'! Reason: {reason}"
+                )
+                contacts.append(None)
                 continue
+            self.created_contacts[google_id] = True
+            self.contacts.append(contact)
+            self._contacts_by_id[google_id] = contact
             self.log.info(f"'{name}': Contact with id '{google_id}' created successfully")
             contacts.append(contact)
         return contacts
@@ -559,23 +799,13 @@ class Google:
         """Updates a given Google contact via api call and returns the updated contact."""
         # Upload contact
         try:
-            result = (
-                self.service.people()
-                .updateContact(
-                    resourceName=data["resourceName"], updatePersonFields=self.update_fields, body=data
-                )
-                .execute()
-            )
-            self.api_requests += 1
+            result = self.__execute(self._people_update(resourceName=data["resourceName"], body=data))
         except HttpError as error:
-            if self.__is_temp_error(error):
-                return self.update_contact(data)
-            else:
-                reason = str(error)
-                msg = f"'{data['names'][0]}':Failed to update Google contact. Reason: {reason}"
-                self.log.warning(msg)
-                print("\n" + msg)
-                raise GoogleFetchError(reason) from error
+            reason = str(error)
+            msg = f"'{data['names'][0]}':Failed to update Google contact. Reason: {reason}"
+            self.log.warning(msg)
+            print("\n" + msg)
+            raise GoogleFetchError(reason) from error
 
         # Process result
         google_id = result.get("resourceName", "-")
@@ -587,17 +817,13 @@ class Google:
         """Deletes a given Google contact via api call."""
         # Upload contact
         try:
-            self.service.people().deleteContact(resourceName=google_id).execute()
-            self.api_requests += 1
+            self.__execute(self.service.people().deleteContact(resourceName=google_id))
         except HttpError as error:
-            if self.__is_temp_error(error):
-                return self.delete_contact(google_id, display_name)
-            else:
-                reason = str(error)
-                msg = f"'{display_name}':Failed to delete Google contact. Reason: {reason}"
-                self.log.warning(msg)
-                print("\n" + msg)
-                raise GoogleFetchError(reason) from error
+            reason = str(error)
+            msg = f"'{display_name}':Failed to delete Google contact. Reason: {reason}"
+            self.log.warning(msg)
+            print("\n" + msg)
+            raise GoogleFetchError(reason) from error
 
         # Finished
         self.log.info(f"'{display_name}': Contact with id '{google_id}' deleted successfully")
@@ -606,17 +832,19 @@ class Google:
 class GoogleContactUploadForm:
     """Creates json form for creating Google contacts."""
 
+    __slots__ = ("data",)
+
     def __init__(
         self,
         first_name: str = "",
         last_name: str = "",
         middle_name: str = "",
-        birthdate: dict = {},
-        phone_numbers: List[str] = [],
-        career: dict = {},
-        email_adresses: List[str] = [],
-        label_ids: List[str] = [],
-        addresses: List[dict] = [],
+        birthdate: Optional[dict] = None,
+        phone_numbers: Optional[List[str]] = None,
+        career: Optional[dict] = None,
+        email_adresses: Optional[List[str]] = None,
+        label_ids: Optional[List[str]] = None,
+        addresses: Optional[List[dict]] = None,
     ) -> None:
         self.data: Dict[str, List[Dict[str, Any]]] = {
             "names": [{"familyName": last_name, "givenName": first_name, "middleName": middle_name}]
@@ -654,20 +882,12 @@ class GoogleContactUploadForm:
 
         if phone_numbers:
             self.data["phoneNumbers"] = [
-                {
-                    "value": number,
-                    "type": "other",
-                }
-                for number in phone_numbers
+                {**OTHER_TYPE_TEMPLATE, "value": number} for number in phone_numbers
             ]
 
         if email_adresses:
             self.data["emailAddresses"] = [
-                {
-                    "value": email,
-                    "type": "other",
-                }
-                for email in email_adresses
+                {**OTHER_TYPE_TEMPLATE, "value": email} for email in email_adresses
             ]
 
         if label_ids:
@@ -1,14 +1,33 @@
 import os
+import time
 from datetime import datetime
 from logging import Logger
 from typing import Any, Dict, List, Tuple, Union
 
 from helpers.DatabaseHelper import Database, DatabaseEntry
 from helpers.Exceptions import BadUserInput, DatabaseError, UserChoice
-from helpers.GoogleHelper import Google, GoogleContactUploadForm
+from helpers.GoogleHelper import BATCH_CREATE_LIMIT, Google, GoogleContactUploadForm
 from helpers.MonicaHelper import Monica, MonicaContactUploadForm
 
 
+class Progress:
+    """Prints throttled 'Processing ... x of y' messages to stdout."""
+
+    def __init__(self, item_name: str, total: int, interval: float = 0.1) -> None:
+        self.item_name = item_name
+        self.total = total
+        self.interval = interval
+        self.last_print_time = 0.0
+
+    def update(self, num: int) -> None:
+        """Prints the progress for the given item number (1-based)
+        if the last message is older than the interval or it is the last item."""
+        now = time.monotonic()
+        if num == self.total or now - self.last_print_time >= self.interval:
+            self.last_print_time = now
+            print(f"Processing {self.item_name} {num} of {self.total}")
+
+
 class Sync:
     """Handles all syncing and merging issues with Google, Monica and the database."""
 
@@ -59,6 +78,8 @@ class Sync:
         elif sync_type == "full":
             # As this is a full sync, get all contacts at once to save time
             self.monica.get_contacts()
+            # Do not rely on cached Google labels for a full sync
+            self.google.refresh_label_mapping()
             # Full sync requested so dont use database timestamps here
             self.__sync("full", is_date_based_sync=False)
         elif sync_type == "delta" and not self.next_sync_token:
@@ -67,6 +88,7 @@ class Sync:
             self.log.info(msg)
             print(msg + "\n")
             # Do a full sync with database timestamp comparison (fast)
+            self.google.refresh_label_mapping()
             self.__sync("full")
         elif sync_type == "delta":
             # Delta sync requested
@@ -147,8 +169,9 @@ class Sync:
             print("\n" + msg)
 
         # Process every Google contact
+        progress = Progress("Google contact", contact_count)
         for num, google_contact in enumerate(google_contacts):
-            print(f"Processing Google contact {num+1} of {contact_count}")
+            progress.update(num + 1)
 
             # Delete Monica contact if Google contact was deleted (if chosen by user; delta sync only)
             is_deleted = google_contact.get("metadata", {}).get("deleted", False)
@@ -669,8 +692,9 @@ class Sync:
         print("\n" + msg)
 
         # Process every Google contact
+        progress = Progress("Google contact", contact_count)
         for num, google_contact in enumerate(google_contacts):
-            print(f"Processing Google contact {num+1} of {contact_count}")
+            progress.update(num + 1)
             # Try non-interactive search first
             monica_id = self.__simple_monica_id_search(google_contact)
             if not monica_id:
@@ -701,43 +725,30 @@ class Sync:
         contact_count = len(monica_contacts)
 
         # Process every Monica contact
+        synced_monica_ids = set(self.mapping.values())
+        lonely_monica_contacts: Dict[str, dict] = {}
+        google_contact_forms: Dict[str, dict] = {}
+        progress = Progress("Monica contact", contact_count)
         for num, monica_contact in enumerate(monica_contacts):
-            print(f"Processing Monica contact {num+1} of {contact_count}")
-
-            # If there the id isn't in the database: create a new Google contact and upload
-            if str(monica_contact["id"]) not in self.mapping.values():
-                # Create Google contact
-                google_contact = self.create_google_contact(monica_contact)
-                if not google_contact:
-                    msg = (
-                        f"'{monica_contact['complete_name']}': "
-                        "Error encountered at creating new Google contact. Skipping..."
-                    )
-                    self.log.warning(msg)
-                    print(msg)
-                    continue
-                g_contact_display_name = self.google.get_contact_names(google_contact)[3]
-
-                # Update database and mapping
-                database_entry = DatabaseEntry(
-                    google_contact["resourceName"],
-                    monica_contact["id"],
-                    g_contact_display_name,
-                    monica_contact["complete_name"],
-                )
-                self.database.insert_data(database_entry)
-                msg = (
-                    f"'{g_contact_display_name}' ('{google_contact['resourceName']}'): "
-                    "New google contact created (sync back)"
-                )
-                print("\n" + msg)
-                self.log.info(msg)
-                self.__update_mapping(google_contact["resourceName"], str(monica_contact["id"]))
-                msg = (
-                    f"'{google_contact['resourceName']}' <-> '{monica_contact['id']}': "
-                    "New sync connection added"
+            progress.update(num + 1)
+
+            # If there the id isn't in the database: prepare a new Google contact for upload
+            monica_id = str(monica_contact["id"])
+            if monica_id not in synced_monica_ids:
+                lonely_monica_contacts[monica_id] = monica_contact
+                google_contact_forms[monica_id] = self.__get_google_contact_form(monica_contact)
+
+        # Create Google contacts (batch requests) and update database and mapping after each batch
+        monica_ids = list(lonely_monica_contacts)
+        for index in range(0, len(monica_ids), BATCH_CREATE_LIMIT):
+            chunk = monica_ids[index : index + BATCH_CREATE_LIMIT]
+            google_contacts = self.google.create_contacts_by_key(
+                {monica_id: google_contact_forms[monica_id] for monica_id in chunk}
+            )
+            for monica_id in chunk:
+                self.__save_synced_back_contact(
+                    lonely_monica_contacts[monica_id], google_contacts.get(monica_id)
                 )
-                self.log.info(msg)
 
         if not self.google.created_contacts:
             msg = "No contacts for sync back found"
@@ -749,6 +760,39 @@ class Sync:
         self.log.info(msg)
         print(msg)
 
+    def __save_synced_back_contact(
+        self, monica_contact: dict, google_contact: Union[dict, None]
+    ) -> None:
+        """Adds a database entry and mapping for a Google contact created by sync back."""
+        if not google_contact:
+            msg = (
+                f"'{monica_contact['complete_name']}': "
+                "Error encountered at creating new Google contact. Skipping..."
+            )
+            self.log.warning(msg)
+            print(msg)
+            return
+        g_contact_display_name = self.google.get_contact_names(google_contact)[3]
+        database_entry = DatabaseEntry(
+            google_contact["resourceName"],
+            monica_contact["id"],
+            g_contact_display_name,
+            monica_contact["complete_name"],
+        )
+        self.database.insert_data(database_entry)
+        msg = (
+            f"'{g_contact_display_name}' ('{google_contact['resourceName']}'): "
+            "New google contact created (sync back)"
+        )
+        print("\n" + msg)
+        self.log.info(msg)
+        self.__update_mapping(google_contact["resourceName"], str(monica_contact["id"]))
+        msg = (
+            f"'{google_contact['resourceName']}' <-> '{monica_contact['id']}': "
+            "New sync connection added"
+        )
+        self.log.info(msg)
+
     def __print_sync_statistics(self) -> None:
         """Prints and logs a pretty sync statistic of the last sync."""
         self.monica.update_statistics()
@@ -787,8 +831,8 @@ class Sync:
         print(msg)
         self.log.info(msg)
 
-    def create_google_contact(self, monica_contact: dict) -> dict:
-        """Creates a new Google contact from a given Monica contact and returns it."""
+    def __get_google_contact_form(self, monica_contact: dict) -> dict:
+        """Returns the Google contact upload form data for a given Monica contact."""
         # Get names (no nickname)
         first_name = monica_contact["first_name"] or ""
         last_name = monica_contact["last_name"] or ""
@@ -855,10 +899,7 @@ class Sync:
             addresses=addresses,
         )
 
-        # Upload contact
-        contact = self.google.create_contact(data=form.get_data())
-
-        return contact
+        return form.get_data()
 
     def __get_monica_middle_name(
         self, first_name: str, last_name: str, nickname: str, full_name: str
@@ -882,8 +923,9 @@ class Sync:
         google_contacts_not_synced = []
         google_contacts_count = len(google_contacts)
         # Check every Google contact
+        progress = Progress("Google contact", google_contacts_count)
         for num, google_contact in enumerate(google_contacts):
-            print(f"Processing Google contact {num+1} of {google_contacts_count}")
+            progress.update(num + 1)
 
             # Get monica id
             monica_id = self.mapping.get(google_contact["resourceName"], None)
@@ -911,9 +953,18 @@ class Sync:
         errors = 0
         monica_contacts_not_synced = []
         monica_contacts_count = len(monica_contacts)
+        # Fetch all synced Google contacts at once (batch requests)
+        self.google.get_contacts_by_id(
+            [
+                google_id
+                for monica_contact in monica_contacts
+                if (google_id := self.reverse_mapping.get(str(monica_contact["id"]), None))
+            ]
+        )
         # Check every Monica contact
+        progress = Progress("Monica contact", monica_contacts_count)
         for num, monica_contact in enumerate(monica_contacts):
-            print(f"Processing Monica contact {num+1} of {monica_contacts_count}")
+            progress.update(num + 1)
 
             # Get Google id
             google_id = self.reverse_mapping.get(str(monica_contact["id"]), None)